@@ -1,4 +1,4 @@
-from typing import List, Dict, Optional, Tuple, Union
+from typing import Iterator, List, Dict, Optional, Tuple, Union
 
 from .exceptions import (
     InvalidInteger,
@@ -6,18 +6,46 @@ from .exceptions import (
     InvalidList,
     InvalidDictionary
     )
+from .view import ListView, DictView
+
+# Byte values of bencode markers, compared against the ints produced by indexing bytes.
+_INTEGER_START = ord("i")
+_LIST_START = ord("l")
+_DICTIONARY_START = ord("d")
+_END = ord("e")
+_MINUS = ord("-")
+_ZERO = ord("0")
+_NINE = ord("9")
+
+# Name of the Decoder method for each possible first byte of a value, None for invalid bytes.
+# Names rather than functions so that methods overridden by subclasses are used for top-level values.
+# Nested containers are decoded by _decode_container, which still calls decode_integer and decode_string.
+_DISPATCH = [None]*256
+_DISPATCH[_INTEGER_START] = "decode_integer"
+_DISPATCH[_LIST_START] = "decode_list"
+_DISPATCH[_DICTIONARY_START] = "decode_dictionary"
+for _character in range(_ZERO, _NINE+1):
+    _DISPATCH[_character] = "decode_string"
+del _character
+
+# Digit runs at least this long are converted with int() instead of one digit at a time.
+_LONG_INTEGER_DIGITS = 3
 
 class Decoder:
     """Decodes bencode data."""
-    def __init__(self: "Decoder", encoding: Optional[str] = None) -> None:
+    def __init__(self: "Decoder", encoding: Optional[str] = None, zero_copy: bool = False) -> None:
         """
         Initialize Decoder.
 
         Parameters:
             - encoding (str, optional): Encoding for bencode string. (default: None)
+            - zero_copy (bool, optional): Return string values inside lists and dictionaries as memoryview
+              slices of the data instead of bytes copies. Each view keeps the whole input buffer alive, so copy the ones
+              kept long after decoding with bytes(). Dictionary keys stay bytes. Ignored when encoding is set. (default: False)
         """
 
         self.encoding = encoding
+        self.zero_copy = zero_copy
     
     def decode_integer(self: "Decoder", value: bytes, pos: int = 0) -> Tuple[int, int]:
         """
@@ -29,7 +57,6 @@ class Decoder:
         
         Raises:
             - InvalidInteger: if bencoded integer is invalid.
-            - ValueError: if integer is invalid.
         
         Returns:
             Tuple[int, int]: a tuple of integer and next position.
@@ -40,39 +67,66 @@ class Decoder:
             >>> decoder.decode_integer(b"i42e")
             (42, 4)
         """
-        start_index = value.find(b"i", pos)
-        if start_index == -1:
-            raise InvalidInteger("Integer start 'i' not found")
-        
-        end_index = value.find(b"e", pos)
-        if end_index == -1:
-            raise InvalidInteger("Interger end 'e' not found")
+        length = len(value)
+        if pos >= length or value[pos] != _INTEGER_START:
+            raise InvalidInteger(f"Integer start 'i' not found (position: {pos})")
         
-        if value[start_index+1:start_index+2] == b"0" and start_index+2 != end_index:
-            raise InvalidInteger(f"Integer cannot start with leading zero (postion: {start_index+1})")
-        elif value[start_index+1:start_index+2] == b"-" and value[start_index+2:start_index+3] == b"0":
-            raise InvalidInteger(f"Negative zero is not allowed (position: {start_index+1})")
-        
-        integer = value[start_index+1:end_index]
+        curr_index = pos+1
         try:
-            return (int(integer), end_index+1)
+            end_index = value.index(b"e", curr_index)
         except ValueError:
-            raise InvalidInteger(f"Invalid integer: {integer} is not a valid integer (position: {start_index+1})")
+            raise InvalidInteger("Interger end 'e' not found")
+        
+        negative = value[curr_index] == _MINUS
+        if negative:
+            curr_index += 1
+        start_index = curr_index
+        
+        if end_index - start_index < _LONG_INTEGER_DIGITS:
+            # accumulate short runs in place instead of slicing and calling int()
+            integer = 0
+            while curr_index < end_index:
+                character = value[curr_index]
+                if not _ZERO <= character <= _NINE:
+                    raise InvalidInteger(f"Invalid integer: {value[pos+1:end_index]} is not a valid integer (position: {pos+1})")
+                integer = integer*10 + character - _ZERO
+                curr_index += 1
+        else:
+            # long runs are handed to int(), which converts the whole run in C
+            digits = value[start_index:end_index]
+            if not digits.isdigit():
+                raise InvalidInteger(f"Invalid integer: {value[pos+1:end_index]} is not a valid integer (position: {pos+1})")
+            
+            try:
+                integer = int(digits)
+            except ValueError:
+                # int() refuses runs beyond sys.get_int_max_str_digits()
+                raise InvalidInteger(f"Invalid integer: {value[pos+1:end_index]} is not a valid integer (position: {pos+1})")
+            curr_index = end_index
+        
+        if curr_index == start_index:
+            raise InvalidInteger(f"Invalid integer: {value[pos+1:curr_index]} is not a valid integer (position: {pos+1})")
+        elif negative and value[start_index] == _ZERO:
+            raise InvalidInteger(f"Negative zero is not allowed (position: {pos+1})")
+        elif value[start_index] == _ZERO and curr_index != start_index+1:
+            raise InvalidInteger(f"Integer cannot start with leading zero (postion: {pos+1})")
+        
+        return (-integer if negative else integer, curr_index+1)
     
-    def decode_string(self: "Decoder", value: bytes, pos: int = 0) -> Tuple[Union[bytes, str], int]:
+    def decode_string(self: "Decoder", value: bytes, pos: int = 0, view: Optional[memoryview] = None) -> Tuple[Union[bytes, str, memoryview], int]:
         """
         Decode a bencode string.
         
         Parameters:
             - value (bytes): A bencode string in bytes format.
             - pos (int, optional): Position index from where to start parsing string. (default: 0)
+            - view (memoryview, optional): A memoryview of value to slice the string from without copying. (default: None)
         
         Raises:
             - InvalidString: If bencoded string is invalid.
-            - ValueError: If string length is invalid.
         
         Returns:
-            Tuple[Union[bytes, str], int]: A tuple of decoded string and next position.
+            Tuple[Union[bytes, str, memoryview], int]: A tuple of decoded string and next position.
         
         Example:
             >>> from bencode.decoder import Decoder
@@ -80,23 +134,34 @@ class Decoder:
             >>> decoder.decode_string(b"4:spam")
             (b"spam", 6)
         """
-        colon = value.find(b":", pos)
-        if colon == -1:
+        if pos >= len(value) or not _ZERO <= value[pos] <= _NINE:
+            if value[pos:pos+1] == b"-":
+                raise InvalidString("Negative length of string not allowed")
+            raise InvalidString(f"String length not found (position: {pos})")
+        
+        try:
+            colon = value.index(b":", pos)
+        except ValueError:
             raise InvalidString("String colon not found")
-        elif value[pos:pos+1] == b"-":
-            raise InvalidString("Negative length of string not allowed")
         
+        # int() alone would also accept whitespace, signs and underscores
+        length_digits = value[pos:colon]
+        if not length_digits.isdigit():
+            raise InvalidString(f"Invalid length integer for string: {length_digits}")
         try:
-            length = int(value[pos:colon])
+            length = int(length_digits)
         except ValueError:
-            raise InvalidString(f"Invalid length integer for string: {value[pos:colon]}")
+            # int() refuses lengths beyond sys.get_int_max_str_digits()
+            raise InvalidString(f"Invalid length integer for string: {length_digits}")
         
         end_index = colon+1+length
-        content = value[colon+1:end_index]
-        
-        if len(content) < length:
+        if end_index > len(value):
             raise InvalidString(f"String length is lesser than {length}")
         
+        if view is not None:
+            return (view[colon+1:end_index], end_index)
+        
+        content = value[colon+1:end_index]
         if self.encoding:
             content = content.decode(self.encoding)
         
@@ -106,6 +171,9 @@ class Decoder:
         """
         Decode a bencode list.
         
+        Nested lists and dictionaries are decoded in the same pass without calling decode_list or
+        decode_dictionary, so overriding either method only affects the outermost container.
+        
         Parameters:
             - value (bytes): A bencode list in bytes format.
             - pos (int, optional): Position index from where to start parsing list. (default: 0)
@@ -122,27 +190,16 @@ class Decoder:
             >>> decoder.decode_list(b"l4:spami42ee")
             ([b'spam', 42], 12)
         """
-        start_index = value.find(b"l", pos)
-        if start_index == -1:
-            raise InvalidList("List start 'l' not found")
-        
-        items = []
-        curr_index = start_index+1
-        while value[curr_index:curr_index+1] != b"e":
-            curr_char = value[curr_index:curr_index+1]
-            if curr_char == b"":
-                raise InvalidList("List end 'e' not found")
-            
-            item, curr_index = self.decode_value(value, curr_index)
-            if item is None:
-                raise InvalidList(f"Invalid list item: {curr_char}")
-            items.append(item)
-        return (items, curr_index+1)
+        if pos >= len(value) or value[pos] != _LIST_START:
+            raise InvalidList(f"List start 'l' not found (position: {pos})")
+        return self._decode_container(value, pos)
     
     def decode_dictionary(self: "Decoder", value: bytes, pos: int = 0) -> Tuple[Dict, int]:
         """
         Decode bencode data.
         
+        As with decode_list, dictionaries nested inside the value do not go through this method.
+        
         Parameters:
             - value (bytes): Bencode data in bytes format.
         
@@ -158,40 +215,100 @@ class Decoder:
             >>> decoder.decode_dictionary(b"d3:bar4:spam3:fooi42ee")
             ({b'bar': b'spam', b'foo': 42}, 22)
         """
-        start_index = value.find(b"d", pos)
-        if start_index == -1:
-            raise InvalidDictionary("Dictionary start 'd' not found")
+        if pos >= len(value) or value[pos] != _DICTIONARY_START:
+            raise InvalidDictionary(f"Dictionary start 'd' not found (position: {pos})")
+        return self._decode_container(value, pos)
+    
+    def _decode_container(self: "Decoder", value: bytes, pos: int) -> Tuple[Union[List, Dict], int]:
+        """
+        Decode a bencode list or dictionary, including nested containers, without recursion.
         
-        items = {}
-        curr_index = start_index+1
-        while value[curr_index:curr_index+1] != b"e":
-            curr_char = value[curr_index:curr_index+1]
-            if curr_char == b"":
+        Parameters:
+            - value (bytes): Bencode data in bytes format.
+            - pos (int): Position index of the container start 'l' or 'd'.
+        
+        Raises:
+            - InvalidList: If a bencoded list is invalid.
+            - InvalidDictionary: If a bencoded dictionary is invalid.
+        
+        Returns:
+            Tuple[Union[List, Dict], int]: A tuple of decoded container and next position.
+        """
+        length = len(value)
+        decode_integer = self.decode_integer
+        decode_string = self.decode_string
+        
+        # string values are sliced from a view of the data, keys stay bytes to be hashable
+        view = memoryview(value) if self.zero_copy and not self.encoding else None
+        
+        # repeated dict keys share one object, e.g. b"length" and b"path" of every file
+        key_cache = {}
+        intern_key = key_cache.setdefault
+        
+        # parent containers of the current one, with the dict key each is waiting to fill
+        stack = []
+        is_dict = value[pos] == _DICTIONARY_START
+        container = {} if is_dict else []
+        key = None
+        curr_index = pos+1
+        while True:
+            if curr_index >= length:
+                if not is_dict:
+                    raise InvalidList("List end 'e' not found")
+                elif key is not None:
+                    raise InvalidDictionary("Invalid dictionary value of the key: b''")
                 raise InvalidDictionary("Dictionary end 'e' not found")
             
-            # key of the dict
-            if curr_char == b"i":
-                k, curr_index = self.decode_integer(value, curr_index)
-            elif b"0" <= curr_char <= b"9":
-                k, curr_index = self.decode_string(value, curr_index)
+            character = value[curr_index]
+            if character == _END:
+                if key is not None:
+                    raise InvalidDictionary(f"Invalid dictionary value of the key: {value[curr_index:curr_index+1]}")
+                
+                curr_index += 1
+                if not stack:
+                    return (container, curr_index)
+                
+                # the finished container becomes an item of its parent
+                item = container
+                container, is_dict, key = stack.pop()
+            elif is_dict and key is None:
+                # key of the dict
+                if character == _INTEGER_START:
+                    key, curr_index = decode_integer(value, curr_index)
+                elif _ZERO <= character <= _NINE:
+                    key, curr_index = decode_string(value, curr_index)
+                else:
+                    raise InvalidDictionary(f"Invalid dictionary key: {value[curr_index:curr_index+1]}")
+                key = intern_key(key, key)
+                continue
+            elif character == _INTEGER_START:
+                item, curr_index = decode_integer(value, curr_index)
+            elif _ZERO <= character <= _NINE:
+                item, curr_index = decode_string(value, curr_index, view)
+            elif character == _LIST_START or character == _DICTIONARY_START:
+                stack.append((container, is_dict, key))
+                is_dict = character == _DICTIONARY_START
+                container = {} if is_dict else []
+                key = None
+                curr_index += 1
+                continue
+            elif is_dict:
+                raise InvalidDictionary(f"Invalid dictionary value of the key: {value[curr_index:curr_index+1]}")
             else:
-                raise InvalidDictionary(f"Invalid dictionary key: {curr_char}")
+                raise InvalidList(f"Invalid list item: {value[curr_index:curr_index+1]}")
             
-            # value of the key
-            curr_char = value[curr_index:curr_index+1]
-            v, curr_index = self.decode_value(value, curr_index)
-            if v is None:
-                raise InvalidDictionary(f"Invalid dictionary value of the key: {curr_char}")
-            
-            items[k] = v
-        return (items, curr_index+1)
+            if is_dict:
+                container[key] = item
+                key = None
+            else:
+                container.append(item)
     
     def decode(self: "Decoder", value: bytes) -> Union[int, bytes, str, Dict, List]:
         """
         Decode bencode data.
         
         Parameters:
-            - value (bytes): Bencode data in bytes format.
+            - value (bytes): Bencode data in bytes format. Other bytes-like objects are copied into bytes once.
         
         Raises:
             - ValueError: If the bencode data is invalid.
@@ -205,18 +322,154 @@ class Decoder:
             >>> decoder.decode(b"i42e4:spamli42eed3:foo3:bare")
             [42, b'spam', [42], {b'foo': b'bar'}]
         """
+        if not isinstance(value, bytes):
+            value = bytes(value)
+        
+        if not value:
+            raise ValueError("Invalid bencode type: b''")
+        
         curr_index = 0
         items = []
-        while value[curr_index:curr_index+1] != b"":
-            curr_char = value[curr_index:curr_index+1]
-            
-            item, curr_index = self.decode_value(value, curr_index)
+        append = items.append
+        decode_value = self.decode_value
+        length = len(value)
+        while curr_index < length:
+            item, next_index = decode_value(value, curr_index)
             if item is None:
-                raise ValueError(f"Invalid bencode type: {curr_char}")
+                raise ValueError(f"Invalid bencode type: {value[curr_index:curr_index+1]}")
             
-            items.append(item)
+            append(item)
+            curr_index = next_index
+        return items if len(items) > 1 else items[0]
+    
+    def decode_view(self: "Decoder", value: bytes) -> Union[int, bytes, str, DictView, ListView, List]:
+        """
+        Decode bencode data lazily.
+        
+        Lists and dictionaries are returned as read-only views over the data. Their items are
+        only decoded when accessed, so reading a few fields of a large torrent does not copy
+        or decode the rest of it.
+        
+        Parameters:
+            - value (bytes): Bencode data in bytes format. Other bytes-like objects are copied into bytes once.
+        
+        Raises:
+            - ValueError: If the bencode data is invalid.
+        
+        Returns:
+            Union[int, bytes, str, DictView, ListView, List]: Decoded bencode data.
+        
+        Example:
+            >>> from bencode.decoder import Decoder
+            >>> decoder = Decoder()
+            >>> torrent = decoder.decode_view(b"d3:bar4:spam3:fooi42ee")
+            >>> torrent[b"foo"]
+            42
+        """
+        if not isinstance(value, bytes):
+            value = bytes(value)
+        
+        if not value:
+            raise ValueError("Invalid bencode type: b''")
+        
+        # end position of every container, shared by all views of the data
+        ends = {}
+        
+        curr_index = 0
+        items = []
+        length = len(value)
+        while curr_index < length:
+            # check the structure up front so views can trust their offsets
+            next_index = self._scan_value(value, curr_index, ends)
+            items.append(self._decode_lazy(value, curr_index, ends))
+            curr_index = next_index
         return items if len(items) > 1 else items[0]
     
+    def decode_events(self: "Decoder", value: bytes) -> Iterator[Tuple]:
+        """
+        Decode bencode data as a stream of events without building lists or dictionaries.
+        
+        Events are tuples: ("int", value), ("str", value) and ("key", value) for dictionary keys,
+        with ("list_start",), ("list_end",), ("dict_start",) and ("dict_end",) around containers.
+        Invalid data is reported when the stream reaches it, so a caller looking for a few fields
+        can stop iterating once it has them without decoding the rest.
+        
+        Parameters:
+            - value (bytes): Bencode data in bytes format. Other bytes-like objects are copied into bytes once.
+        
+        Raises:
+            - ValueError: If the bencode data is invalid.
+        
+        Yields:
+            Tuple: Decoding events in the order of the data.
+        
+        Example:
+            >>> from bencode.decoder import Decoder
+            >>> decoder = Decoder()
+            >>> list(decoder.decode_events(b"d3:fooli42eee"))
+            [('dict_start',), ('key', b'foo'), ('list_start',), ('int', 42), ('list_end',), ('dict_end',)]
+        """
+        if not isinstance(value, bytes):
+            value = bytes(value)
+        
+        length = len(value)
+        decode_integer = self.decode_integer
+        decode_string = self.decode_string
+        
+        # whether each open container is a dict, and whether the innermost dict waits for a key
+        stack = []
+        expect_key = False
+        curr_index = 0
+        while curr_index < length or stack:
+            in_dict = bool(stack) and stack[-1]
+            if curr_index >= length:
+                if not in_dict:
+                    raise InvalidList("List end 'e' not found")
+                elif not expect_key:
+                    raise InvalidDictionary("Invalid dictionary value of the key: b''")
+                raise InvalidDictionary("Dictionary end 'e' not found")
+            
+            character = value[curr_index]
+            if stack and character == _END:
+                if in_dict and not expect_key:
+                    raise InvalidDictionary(f"Invalid dictionary value of the key: {value[curr_index:curr_index+1]}")
+                
+                stack.pop()
+                curr_index += 1
+                # the finished container was the value of its parent's key
+                expect_key = bool(stack) and stack[-1]
+                yield ("dict_end",) if in_dict else ("list_end",)
+            elif in_dict and expect_key:
+                # key of the dict
+                if character == _INTEGER_START:
+                    key, curr_index = decode_integer(value, curr_index)
+                elif _ZERO <= character <= _NINE:
+                    key, curr_index = decode_string(value, curr_index)
+                else:
+                    raise InvalidDictionary(f"Invalid dictionary key: {value[curr_index:curr_index+1]}")
+                expect_key = False
+                yield ("key", key)
+            elif character == _INTEGER_START:
+                item, curr_index = decode_integer(value, curr_index)
+                expect_key = in_dict
+                yield ("int", item)
+            elif _ZERO <= character <= _NINE:
+                item, curr_index = decode_string(value, curr_index)
+                expect_key = in_dict
+                yield ("str", item)
+            elif character == _LIST_START or character == _DICTIONARY_START:
+                is_dict = character == _DICTIONARY_START
+                stack.append(is_dict)
+                expect_key = is_dict
+                curr_index += 1
+                yield ("dict_start",) if is_dict else ("list_start",)
+            elif not stack:
+                raise ValueError(f"Invalid bencode type: {value[curr_index:curr_index+1]}")
+            elif in_dict:
+                raise InvalidDictionary(f"Invalid dictionary value of the key: {value[curr_index:curr_index+1]}")
+            else:
+                raise InvalidList(f"Invalid list item: {value[curr_index:curr_index+1]}")
+    
     def decode_value(self: "Decoder", value: bytes, index: Optional[int] = 0) -> Optional[Tuple[Union[int, bytes, str, List, Dict], int]]:
         """
         Decode a bencode value.
@@ -228,14 +481,235 @@ class Decoder:
         Returns:
             Optional[Tuple[Union[int, bytes, str, List, Dict], int]]: A tuple of decoded value and next position.
         """
-        character = value[index:index+1]
-        if character == b"i":
-            return self.decode_integer(value, index)
-        elif b"0" <= character <= b"9":
-            return self.decode_string(value, index)
-        elif character == b"l":
-            return self.decode_list(value, index)
-        elif character == b"d":
-            return self.decode_dictionary(value, index)
-        else:
+        if index >= len(value):
+            return (None, None)
+        
+        # a single table lookup on the byte replaces a chain of comparisons
+        name = _DISPATCH[value[index]]
+        if name is None:
             return (None, None)
+        return getattr(self, name)(value, index)
+    
+    def _decode_lazy(self: "Decoder", value: bytes, pos: int, ends: Dict[int, int]) -> Union[int, bytes, str, DictView, ListView]:
+        """
+        Decode a bencode value, returning a view for lists and dictionaries.
+        
+        Parameters:
+            - value (bytes): Bencode data in bytes format.
+            - pos (int): Position index of a value whose structure was checked by _scan_value.
+            - ends (Dict[int, int]): End position of every container, recorded by _scan_value.
+        
+        Returns:
+            Union[int, bytes, str, DictView, ListView]: Decoded value or a view of it.
+        """
+        character = value[pos]
+        if character == _LIST_START:
+            return ListView(self, value, pos, ends)
+        elif character == _DICTIONARY_START:
+            return DictView(self, value, pos, ends)
+        return self.decode_value(value, pos)[0]
+    
+    def _scan_value(self: "Decoder", value: bytes, pos: int, ends: Dict[int, int]) -> int:
+        """
+        Find the end of a bencode value in a single pass, recording the end of every container in it.
+        
+        Only the structure is checked. Integers and strings are fully validated once decoded.
+        
+        Parameters:
+            - value (bytes): Bencode data in bytes format.
+            - pos (int): Position index of the value.
+            - ends (Dict[int, int]): Mapping of container start to end position to fill in.
+        
+        Raises:
+            - ValueError: If the bencode data is invalid.
+        
+        Returns:
+            int: Position after the value.
+        """
+        length = len(value)
+        index = value.index
+        
+        # start positions of the containers that are still open
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        curr_index = pos
+        try:
+            while True:
+                character = value[curr_index]
+                if _ZERO <= character <= _NINE:
+                    colon = index(b":", curr_index)
+                    length_digits = value[curr_index:colon]
+                    if not length_digits.isdigit():
+                        break
+                    curr_index = colon+1+int(length_digits)
+                elif character == _INTEGER_START:
+                    curr_index = index(b"e", curr_index+1)+1
+                elif character == _LIST_START or character == _DICTIONARY_START:
+                    push(curr_index)
+                    curr_index += 1
+                    continue
+                elif character == _END and stack:
+                    curr_index += 1
+                    ends[pop()] = curr_index
+                else:
+                    break
+                
+                if not stack:
+                    if curr_index > length:
+                        break
+                    return curr_index
+        except (IndexError, ValueError):
+            pass
+        
+        # the data is invalid, walk it again with full checks to raise the matching error
+        self._skip_value(value, pos)
+        raise ValueError(f"Invalid bencode data (position: {pos})")
+    
+    def _skip_value(self: "Decoder", value: bytes, pos: int) -> int:
+        """
+        Find the end of a bencode value without decoding it, raising a precise error for invalid data.
+        
+        Only the structure is checked. Integers and strings are fully validated once decoded.
+        
+        Parameters:
+            - value (bytes): Bencode data in bytes format.
+            - pos (int): Position index of the value.
+        
+        Raises:
+            - ValueError: If the bencode data is invalid.
+        
+        Returns:
+            int: Position after the value.
+        """
+        length = len(value)
+        
+        # markers of the containers that are still open
+        stack = []
+        curr_index = pos
+        while True:
+            if curr_index >= length:
+                if not stack:
+                    raise ValueError("Invalid bencode type: b''")
+                elif stack[-1] == _LIST_START:
+                    raise InvalidList("List end 'e' not found")
+                raise InvalidDictionary("Dictionary end 'e' not found")
+            
+            character = value[curr_index]
+            if character == _INTEGER_START:
+                try:
+                    curr_index = value.index(b"e", curr_index+1)+1
+                except ValueError:
+                    raise InvalidInteger("Interger end 'e' not found")
+            elif _ZERO <= character <= _NINE:
+                try:
+                    colon = value.index(b":", curr_index)
+                except ValueError:
+                    raise InvalidString("String colon not found")
+                
+                length_digits = value[curr_index:colon]
+                if not length_digits.isdigit():
+                    raise InvalidString(f"Invalid length integer for string: {length_digits}")
+                try:
+                    string_length = int(length_digits)
+                except ValueError:
+                    raise InvalidString(f"Invalid length integer for string: {length_digits}")
+                
+                curr_index = colon+1+string_length
+                if curr_index > length:
+                    raise InvalidString(f"String length is lesser than {string_length}")
+            elif character == _LIST_START or character == _DICTIONARY_START:
+                stack.append(character)
+                curr_index += 1
+                continue
+            elif character == _END and stack:
+                stack.pop()
+                curr_index += 1
+            elif not stack:
+                raise ValueError(f"Invalid bencode type: {value[curr_index:curr_index+1]}")
+            elif stack[-1] == _LIST_START:
+                raise InvalidList(f"Invalid list item: {value[curr_index:curr_index+1]}")
+            else:
+                raise InvalidDictionary(f"Invalid dictionary item: {value[curr_index:curr_index+1]}")
+            
+            if not stack:
+                return curr_index
+    
+    def _value_end(self: "Decoder", value: bytes, pos: int, ends: Dict[int, int]) -> int:
+        """
+        Find the end of a bencode value checked by _scan_value without scanning containers again.
+        
+        Parameters:
+            - value (bytes): Bencode data in bytes format.
+            - pos (int): Position index of the value.
+            - ends (Dict[int, int]): End position of every container, recorded by _scan_value.
+        
+        Returns:
+            int: Position after the value.
+        """
+        character = value[pos]
+        if character == _INTEGER_START:
+            return value.index(b"e", pos+1)+1
+        elif _ZERO <= character <= _NINE:
+            colon = value.index(b":", pos)
+            return colon+1+int(value[pos:colon])
+        return ends[pos]
+    
+    def _list_offsets(self: "Decoder", value: bytes, pos: int, ends: Dict[int, int]) -> List[int]:
+        """
+        Find the position of every item of a bencode list checked by _scan_value.
+        
+        Parameters:
+            - value (bytes): Bencode data in bytes format.
+            - pos (int): Position index of the list start 'l'.
+            - ends (Dict[int, int]): End position of every container, recorded by _scan_value.
+        
+        Returns:
+            List[int]: Position of each item.
+        """
+        offsets = []
+        append = offsets.append
+        value_end = self._value_end
+        curr_index = pos+1
+        while value[curr_index] != _END:
+            append(curr_index)
+            curr_index = value_end(value, curr_index, ends)
+        return offsets
+    
+    def _dictionary_offsets(self: "Decoder", value: bytes, pos: int, ends: Dict[int, int]) -> Dict[Union[int, bytes, str], int]:
+        """
+        Decode the keys of a bencode dictionary checked by _scan_value and find the position of each value.
+        
+        Parameters:
+            - value (bytes): Bencode data in bytes format.
+            - pos (int): Position index of the dictionary start 'd'.
+            - ends (Dict[int, int]): End position of every container, recorded by _scan_value.
+        
+        Raises:
+            - InvalidDictionary: If a key or value is missing or invalid.
+        
+        Returns:
+            Dict[Union[int, bytes, str], int]: Position of the value of each key.
+        """
+        offsets = {}
+        decode_integer = self.decode_integer
+        decode_string = self.decode_string
+        value_end = self._value_end
+        curr_index = pos+1
+        while value[curr_index] != _END:
+            # key of the dict
+            curr_char = value[curr_index]
+            if curr_char == _INTEGER_START:
+                k, curr_index = decode_integer(value, curr_index)
+            elif _ZERO <= curr_char <= _NINE:
+                k, curr_index = decode_string(value, curr_index)
+            else:
+                raise InvalidDictionary(f"Invalid dictionary key: {value[curr_index:curr_index+1]}")
+            
+            # value of the key
+            if value[curr_index] == _END:
+                raise InvalidDictionary(f"Invalid dictionary value of the key: {value[curr_index:curr_index+1]}")
+            
+            offsets[k] = curr_index
+            curr_index = value_end(value, curr_index, ends)
+        return offsets
\ No newline at end of file
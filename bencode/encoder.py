@@ -1,5 +1,12 @@
 from typing import Dict, List, Optional, Union
 
+# Pre-encoded small integers and string length prefixes, shared by all encoders.
+_SMALL_INTEGERS = {i: b"i%de" % i for i in range(-256, 257)}
+_LENGTH_PREFIXES = tuple(b"%d:" % length for length in range(65))
+
+# Maximum number of dictionary keys an encoder keeps pre-encoded.
+_KEY_CACHE_SIZE = 256
+
 class Encoder:
     """Encodes Python data types into bencode format."""
     
@@ -11,6 +18,9 @@ class Encoder:
             - encoding (str, optional): Encoding for bencode string. (default: "utf-8")
         """
         self.encoding = encoding
+        
+        # key encoding -> {dict key -> (key bytes to sort by, encoded key)}
+        self._key_caches = {}
     
     def encode_integer(self: "Encoder", value: int, encoding: Optional[str] = None) -> bytes:
         """
@@ -34,14 +44,19 @@ class Encoder:
         """
         if not isinstance(value, int):
             raise TypeError(f"Value must be an integer")
-        return f"i{value}e".encode(encoding if encoding else self.encoding)
+        encoded = _SMALL_INTEGERS.get(value)
+        if encoded is not None:
+            return encoded
+        
+        # the encoded integer is always ASCII, so format it straight into bytes
+        return b"i%de" % value
     
-    def encode_string(self: "Encoder", value: str, encoding: Optional[str] = None) -> bytes:
+    def encode_string(self: "Encoder", value: Union[str, bytes, bytearray, memoryview], encoding: Optional[str] = None) -> bytes:
         """
         Encode a string into bencode format.
         
         Parameters:
-            - value (str): String to be encoded.
+            - value (Union[str, bytes, bytearray, memoryview]): String to be encoded. str is encoded first, the others are used as raw bytes.
             - encoding (str, optional): Encoding for bencode string. (default: None)
         
         Returns:
@@ -53,7 +68,16 @@ class Encoder:
             >>> encoder.encode_string("spam")
             b'4:spam'
         """
-        return f"{len(value)}:{value}".encode(encoding if encoding else self.encoding)
+        if isinstance(value, str):
+            value = value.encode(encoding if encoding else self.encoding)
+        elif not isinstance(value, bytes):
+            # bytearray or memoryview, e.g. string values from Decoder(zero_copy=True)
+            value = bytes(value)
+        
+        length = len(value)
+        if length < len(_LENGTH_PREFIXES):
+            return _LENGTH_PREFIXES[length] + value
+        return b"%d:%b" % (length, value)
     
     def encode_list(self: "Encoder", value: List, encoding: Optional[str] = None, skip_unknown_types: Optional[bool] = False) -> bytes:
         """
@@ -73,20 +97,28 @@ class Encoder:
             >>> encoder.encode_list([42, "spam"])
             b'li42e4:spame'
         """
-        result = b"l"
+        parts = [b"l"]
+        append = parts.append
+        encode_value = self.encode_value
         for item in value:
-            result += self.encode_value(item)
-        return result + b"e"
+            append(encode_value(item, encoding))
+        append(b"e")
+        return b"".join(parts)
     
     def encode_dictionary(self: "Encoder", value: Dict, encoding: Optional[str] = None, skip_unknown_types: Optional[bool] = False) -> bytes:
         """
         Encode a dictionary into bencode format.
         
+        Keys are sorted by their encoded bytes, as required by the bencode specification.
+        
         Parameters:
             - value (Dict): Dictionary to be encoded.
             - encoding (str, optional): Encoding for bencode string. (default: None)
             - skip_unknown_types (bool): Whether to skip encoding unknown types. (default: False)
         
+        Raises:
+            - ValueError: If a key is not str or bytes, or two keys encode to the same bytes.
+        
         Returns:
             bytes: Encoded bencode dictionary.
         
@@ -96,15 +128,48 @@ class Encoder:
             >>> encoder.encode_dictionary({"foo": "bar"})
             b'd3:foo3:bare'
         """
-        result = b"d"
+        key_encoding = encoding if encoding else self.encoding
+        # one cache per encoding, so alternating encodings do not evict each other
+        key_cache = self._key_caches.setdefault(key_encoding, {})
+        
+        encode_value = self.encode_value
+        items = []
         for k, v in value.items():
-            result += self.encode_value(k)
-            result += self.encode_value(v)
-        return result + b"e"
+            # torrents reuse a small set of keys, so most are encoded only once per encoder
+            key = key_cache.get(k)
+            if key is None:
+                if isinstance(k, str):
+                    raw_key = k.encode(key_encoding)
+                elif isinstance(k, bytes):
+                    raw_key = k
+                else:
+                    raise ValueError(f"Invalid dictionary key type: {type(k)} (keys must be str or bytes)")
+                
+                key = (raw_key, encode_value(raw_key))
+                if len(key_cache) >= _KEY_CACHE_SIZE:
+                    # evict the oldest key, dicts keep insertion order
+                    key_cache.pop(next(iter(key_cache)), None)
+                key_cache[k] = key
+            items.append((key, v))
+        items.sort(key=lambda item: item[0][0])
+        
+        parts = [b"d"]
+        append = parts.append
+        previous_key = None
+        for key, v in items:
+            # e.g. "a" and b"a" would both be written as 1:a
+            if key[0] == previous_key:
+                raise ValueError(f"Duplicate dictionary key: {key[0]}")
+            previous_key = key[0]
+            
+            append(key[1])
+            append(encode_value(v, encoding))
+        append(b"e")
+        return b"".join(parts)
     
     def encode_value(
         self: "Encoder",
-        value: Union[int, bytes, List, Dict],
+        value: Union[int, str, bytes, bytearray, memoryview, List, Dict],
         encoding: Optional[str] = None,
         skip_unknown_types: Optional[bool] = False
         ) -> None:
@@ -112,7 +177,7 @@ class Encoder:
         Encode a Python data type into bencode format.
         
         Parameters:
-            - value (Union[int, str, List, Dict]): Value to be encoded.
+            - value (Union[int, str, bytes, bytearray, memoryview, List, Dict]): Value to be encoded.
             - encoding (str, optional): Encoding for bencode string. (default: None)
             - skip_unknown_types (bool): Whether to skip encoding unknown types. (default: False)
         
@@ -124,12 +189,12 @@ class Encoder:
         """
         if isinstance(value, int):
             return self.encode_integer(value, encoding)
-        elif isinstance(value, str):
+        elif isinstance(value, (str, bytes, bytearray, memoryview)):
             return self.encode_string(value, encoding)
         elif isinstance(value, list):
             return self.encode_list(value, encoding)
         elif isinstance(value, dict):
-            return self.encode_dictionary(ValueError, encoding)
+            return self.encode_dictionary(value, encoding)
         else:
             if not skip_unknown_types:
                 raise ValueError(f"Invalid bencode type: {type(value)}")
@@ -0,0 +1,99 @@
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+class ListView(Sequence):
+    """Read-only view of a bencode list whose items are decoded on first access."""
+    
+    def __init__(self: "ListView", decoder: Any, value: bytes, pos: int, ends: Dict[int, int]) -> None:
+        """
+        Initialize ListView.
+        
+        Parameters:
+            - decoder (Decoder): Decoder used to decode the items.
+            - value (bytes): Bencode data containing the list.
+            - pos (int): Position index of the list start 'l'.
+            - ends (Dict[int, int]): End position of every container in value, shared by all views of it.
+        """
+        self.decoder = decoder
+        self.value = value
+        self.pos = pos
+        self.ends = ends
+        self._offsets: Optional[List[int]] = None
+        self._items: Dict[int, Any] = {}
+    
+    def _load_offsets(self: "ListView") -> List[int]:
+        """Find the position of every item without decoding them."""
+        if self._offsets is None:
+            self._offsets = self.decoder._list_offsets(self.value, self.pos, self.ends)
+        return self._offsets
+    
+    def __getitem__(self: "ListView", index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        
+        offsets = self._load_offsets()
+        if index < 0:
+            index += len(offsets)
+        if not 0 <= index < len(offsets):
+            raise IndexError("ListView index out of range")
+        
+        if index not in self._items:
+            self._items[index] = self.decoder._decode_lazy(self.value, offsets[index], self.ends)
+        return self._items[index]
+    
+    def __len__(self: "ListView") -> int:
+        return len(self._load_offsets())
+    
+    def __eq__(self: "ListView", other: Any) -> bool:
+        # decoded lists compare equal to views of them, item by item
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+    
+    def __repr__(self: "ListView") -> str:
+        return f"ListView({list(self)!r})"
+
+class DictView(Mapping):
+    """Read-only view of a bencode dictionary whose values are decoded on first access."""
+    
+    def __init__(self: "DictView", decoder: Any, value: bytes, pos: int, ends: Dict[int, int]) -> None:
+        """
+        Initialize DictView.
+        
+        Parameters:
+            - decoder (Decoder): Decoder used to decode the keys and values.
+            - value (bytes): Bencode data containing the dictionary.
+            - pos (int): Position index of the dictionary start 'd'.
+            - ends (Dict[int, int]): End position of every container in value, shared by all views of it.
+        """
+        self.decoder = decoder
+        self.value = value
+        self.pos = pos
+        self.ends = ends
+        self._offsets: Optional[Dict[Union[int, bytes, str], int]] = None
+        self._items: Dict[Union[int, bytes, str], Any] = {}
+    
+    def _load_offsets(self: "DictView") -> Dict[Union[int, bytes, str], int]:
+        """Decode the keys and find the position of every value without decoding them."""
+        if self._offsets is None:
+            self._offsets = self.decoder._dictionary_offsets(self.value, self.pos, self.ends)
+        return self._offsets
+    
+    def __getitem__(self: "DictView", key: Union[int, bytes, str]) -> Any:
+        if key not in self._items:
+            pos = self._load_offsets()[key]
+            self._items[key] = self.decoder._decode_lazy(self.value, pos, self.ends)
+        return self._items[key]
+    
+    def __contains__(self: "DictView", key: Any) -> bool:
+        # only the keys are needed, the value stays undecoded
+        return key in self._load_offsets()
+    
+    def __iter__(self: "DictView") -> Iterator[Union[int, bytes, str]]:
+        return iter(self._load_offsets())
+    
+    def __len__(self: "DictView") -> int:
+        return len(self._load_offsets())
+    
+    def __repr__(self: "DictView") -> str:
+        return f"DictView({dict(self)!r})"
@@ -0,0 +1,209 @@
+import random
+import sys
+import unittest
+
+from bencode.decoder import Decoder
+from bencode.exceptions import (
+    InvalidInteger,
+    InvalidString,
+    InvalidList,
+    InvalidDictionary
+    )
+from bencode.view import ListView, DictView
+
+SAMPLES = [
+    b"i42e",
+    b"i-7e",
+    b"i0e",
+    b"i-12e",
+    b"i123e",
+    b"i1234567890123456789e",
+    b"0:",
+    b"4:spam",
+    b"le",
+    b"de",
+    b"l4:spami42ee",
+    b"d3:bar4:spam3:fooi42ee",
+    b"d1:ad1:bli1ei2eee1:c0:e",
+    b"di3e1:a1:bi4ee",
+    b"i42e4:spamli42eed3:foo3:bare",
+    b"d8:announce14:http://tracker4:infod5:filesld6:lengthi5e4:pathl1:aeee4:name4:spamee",
+    ]
+
+INVALID = [
+    (b"i", InvalidInteger),
+    (b"ie", InvalidInteger),
+    (b"i01e", InvalidInteger),
+    (b"i-0e", InvalidInteger),
+    (b"i4x", InvalidInteger),
+    (b"i1x2e", InvalidInteger),
+    (b"i12x45e", InvalidInteger),
+    (b"i-e", InvalidInteger),
+    (b"i" + b"1"*5000 + b"e", InvalidInteger),
+    (b"5:ab", InvalidString),
+    (b"3 :abc", InvalidString),
+    (b"1"*5000 + b":x", InvalidString),
+    (b"l", InvalidList),
+    (b"li1e", InvalidList),
+    (b"l-e", InvalidList),
+    (b"d", InvalidDictionary),
+    (b"d1:a", InvalidDictionary),
+    (b"d1:ai1e", InvalidDictionary),
+    (b"dxe", InvalidDictionary),
+    (b"x", ValueError),
+    ]
+
+DECODE_ERRORS = (InvalidInteger, InvalidString, InvalidList, InvalidDictionary, ValueError)
+
+def random_bencode(rng: random.Random, depth: int = 0) -> bytes:
+    """Generate random valid bencode data."""
+    choice = rng.random()
+    if depth > 4 or choice < 0.3:
+        return b"i%de" % rng.randint(-10**12, 10**12)
+    elif choice < 0.6:
+        content = bytes(rng.choice(b"abcdeil:0123") for _ in range(rng.randint(0, 8)))
+        return b"%d:%b" % (len(content), content)
+    elif choice < 0.8:
+        return b"l" + b"".join(random_bencode(rng, depth+1) for _ in range(rng.randint(0, 4))) + b"e"
+    keys = sorted({bytes(rng.choice(b"abc") for _ in range(rng.randint(1, 3))) for _ in range(rng.randint(0, 4))})
+    return b"d" + b"".join(b"%d:%b" % (len(k), k) + random_bencode(rng, depth+1) for k in keys) + b"e"
+
+def materialize(value):
+    """Turn views into plain lists and dictionaries."""
+    if isinstance(value, ListView) or isinstance(value, list):
+        return [materialize(item) for item in value]
+    elif isinstance(value, DictView):
+        return {k: materialize(v) for k, v in value.items()}
+    return value
+
+def from_events(events):
+    """Build decoded values from decode_events output."""
+    items = []
+    stack = []
+    keys = []
+    
+    def add(item):
+        if not stack:
+            items.append(item)
+        elif isinstance(stack[-1], dict):
+            stack[-1][keys.pop()] = item
+        else:
+            stack[-1].append(item)
+    
+    for event in events:
+        kind = event[0]
+        if kind in ("int", "str"):
+            add(event[1])
+        elif kind == "key":
+            keys.append(event[1])
+        elif kind == "list_start":
+            stack.append([])
+        elif kind == "dict_start":
+            stack.append({})
+        else:
+            add(stack.pop())
+    return items if len(items) > 1 else items[0]
+
+class TestDecoder(unittest.TestCase):
+    def setUp(self):
+        self.decoder = Decoder()
+        rng = random.Random(0)
+        self.samples = SAMPLES + [random_bencode(rng) for _ in range(300)]
+    
+    def test_decode(self):
+        self.assertEqual(self.decoder.decode(b"i42e4:spamli42eed3:foo3:bare"), [42, b"spam", [42], {b"foo": b"bar"}])
+        self.assertEqual(Decoder("utf-8").decode(b"d3:bar4:spame"), {"bar": "spam"})
+    
+    def test_decode_view_matches_decode(self):
+        for sample in self.samples:
+            with self.subTest(sample=sample):
+                self.assertEqual(self.decoder.decode_view(sample), self.decoder.decode(sample))
+    
+    def test_decode_events_match_decode(self):
+        for sample in self.samples:
+            with self.subTest(sample=sample):
+                self.assertEqual(from_events(self.decoder.decode_events(sample)), self.decoder.decode(sample))
+    
+    def test_zero_copy_matches_decode(self):
+        decoder = Decoder(zero_copy=True)
+        for sample in self.samples:
+            with self.subTest(sample=sample):
+                self.assertEqual(decoder.decode(sample), self.decoder.decode(sample))
+    
+    def test_zero_copy_keys_stay_bytes(self):
+        decoded = Decoder(zero_copy=True).decode(b"d3:bar4:spam3:fooli1e2:abee")
+        self.assertTrue(all(type(key) is bytes for key in decoded))
+        self.assertIsInstance(decoded[b"bar"], memoryview)
+        self.assertEqual(bytes(decoded[b"bar"]), b"spam")
+        self.assertEqual(bytes(decoded[b"foo"][1]), b"ab")
+    
+    def test_invalid_data(self):
+        for data, error in INVALID:
+            with self.subTest(data=data[:20]):
+                self.assertRaises(error, self.decoder.decode, data)
+                self.assertRaises(error, lambda: list(self.decoder.decode_events(data)))
+                # views check the structure up front, scalars are checked when read
+                self.assertRaises(error, lambda: materialize(self.decoder.decode_view(data)))
+    
+    def test_truncated_data(self):
+        sample = SAMPLES[-1]
+        for end in range(1, len(sample)):
+            with self.subTest(end=end):
+                self.assertRaises(DECODE_ERRORS, self.decoder.decode, sample[:end])
+                self.assertRaises(DECODE_ERRORS, self.decoder.decode_view, sample[:end])
+                self.assertRaises(DECODE_ERRORS, lambda: list(self.decoder.decode_events(sample[:end])))
+    
+    def test_deep_nesting(self):
+        depth = sys.getrecursionlimit() * 2
+        data = b"l"*depth + b"i1e" + b"e"*depth
+        
+        decoded = self.decoder.decode(data)
+        view = self.decoder.decode_view(data)
+        for _ in range(depth):
+            decoded = decoded[0]
+            view = view[0]
+        self.assertEqual(decoded, 1)
+        self.assertEqual(view, 1)
+        self.assertEqual(sum(1 for _ in self.decoder.decode_events(data)), depth*2 + 1)
+    
+    def test_decode_view_reads_fields(self):
+        view = self.decoder.decode_view(SAMPLES[-1])
+        self.assertEqual(view[b"announce"], b"http://tracker")
+        self.assertEqual(view[b"info"][b"files"][0][b"path"][-1], b"a")
+        self.assertEqual(len(view[b"info"]), 2)
+    
+    def test_decode_view_comparisons(self):
+        view = self.decoder.decode_view(b"li1e1:ae")
+        self.assertEqual(view, (1, b"a"))
+        self.assertNotEqual(view, [1])
+        self.assertNotEqual(view, b"\x01a")
+        self.assertRaisesRegex(ValueError, "Invalid bencode type: b''", self.decoder.decode_view, b"")
+        self.assertRaisesRegex(ValueError, "Invalid bencode type: b''", self.decoder.decode, b"")
+    
+    def test_decode_view_membership_skips_values(self):
+        # scalars are checked when read, so a bad value only fails on access
+        view = self.decoder.decode_view(b"d1:ai01ee")
+        self.assertIn(b"a", view)
+        self.assertNotIn(b"b", view)
+        self.assertRaises(InvalidInteger, view.__getitem__, b"a")
+    
+    def test_decode_events_stop_early(self):
+        # the invalid tail is never reached when iteration stops first
+        events = self.decoder.decode_events(b"d8:announce3:url4:infoi1e" + b"x"*10)
+        self.assertEqual(next(events), ("dict_start",))
+        self.assertEqual(next(events), ("key", b"announce"))
+        self.assertEqual(next(events), ("str", b"url"))
+        events.close()
+    
+    def test_subclass_overrides_are_dispatched(self):
+        class DoublingDecoder(Decoder):
+            def decode_integer(self, value, pos=0):
+                integer, end_index = super().decode_integer(value, pos)
+                return integer * 2, end_index
+        
+        self.assertEqual(DoublingDecoder().decode(b"i21e"), 42)
+        # scalars inside containers go through the override too
+        self.assertEqual(DoublingDecoder().decode(b"ld1:ai21eee"), [{b"a": 42}])
+
+if __name__ == "__main__":
+    unittest.main()
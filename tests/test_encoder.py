@@ -0,0 +1,39 @@
+import unittest
+
+from bencode.decoder import Decoder
+from bencode.encoder import Encoder
+
+class TestEncoder(unittest.TestCase):
+    def setUp(self):
+        self.encoder = Encoder()
+    
+    def test_encode(self):
+        self.assertEqual(self.encoder.encode_value([42, "spam", b"\x00", {"foo": "bar"}]), b"li42e4:spam1:\x00d3:foo3:baree")
+        self.assertEqual(self.encoder.encode_value(-1000), b"i-1000e")
+        self.assertEqual(self.encoder.encode_value("é"), b"2:\xc3\xa9")
+    
+    def test_encoding_reaches_nested_values(self):
+        self.assertEqual(self.encoder.encode_value({"k": "é"}, "latin-1"), b"d1:k1:\xe9e")
+        self.assertEqual(self.encoder.encode_value([["é"]], "latin-1"), b"ll1:\xe9ee")
+    
+    def test_dictionary_keys_are_sorted(self):
+        self.assertEqual(self.encoder.encode_value({"zoo": 1, b"bar": 2, "a": {"y": 1, "b": 2}}), b"d1:ad1:bi2e1:yi1ee3:bari2e3:zooi1ee")
+    
+    def test_round_trip(self):
+        data = b"d8:announce14:http://tracker4:infod5:filesld6:lengthi5e4:pathl1:aeee4:name4:spamee"
+        self.assertEqual(self.encoder.encode_value(Decoder().decode(data)), data)
+        self.assertEqual(self.encoder.encode_value(Decoder(zero_copy=True).decode(data)), data)
+        self.assertEqual(self.encoder.encode_value([bytearray(b"ab"), memoryview(b"cd")]), b"l2:ab2:cde")
+    
+    def test_dictionary_keys_per_encoding(self):
+        # the same encoder alternates encodings without reusing keys across them
+        for _ in range(2):
+            self.assertEqual(self.encoder.encode_value({"é": 1}), b"d2:\xc3\xa9i1ee")
+            self.assertEqual(self.encoder.encode_value({"é": 1}, "latin-1"), b"d1:\xe9i1ee")
+    
+    def test_invalid_dictionary_keys(self):
+        self.assertRaises(ValueError, self.encoder.encode_value, {1: 2, b"a": 3})
+        self.assertRaises(ValueError, self.encoder.encode_value, {"a": 1, b"a": 2})
+
+if __name__ == "__main__":
+    unittest.main()